@@ -39,6 +39,10 @@ LOCALE_PATHS = [
     root("openedx_user_groups", "conf", "locale"),
 ]
 
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",  # fast hashing for test users only
+]
+
 ROOT_URLCONF = "openedx_user_groups.urls"
 
 SECRET_KEY = "insecure-secret-key"